@@ -1,17 +1,38 @@
 import argparse
+import asyncio
+import codecs
+import collections
+import concurrent.futures
 import contextlib
+import functools
 import logging
+import mmap
 import os
 import platform
 import re
 import shutil
 import subprocess
 import sys
+import threading
 from dataclasses import dataclass
+from typing import AnyStr, Callable
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Directory names that are never searched for images
+BLOCK_NAMES = frozenset({".git", ".github", "ci", "docs", "manifests", "scripts", "tests"})
+
+# Files up to this size are read in a single call instead of being memory-mapped
+SMALL_FILE_SIZE = 64 * 1024
+
+# Extensions of binary files, e.g. the VS Code extensions bundled with codeserver, whose contents are never rewritten
+BINARY_EXTENSIONS = frozenset({".bz2", ".gif", ".gz", ".ico", ".jar", ".jpeg", ".jpg", ".pdf", ".png", ".so", ".tar",
+                               ".tgz", ".ttf", ".vsix", ".whl", ".woff", ".woff2", ".xz", ".zip"})
+
+# Directory names of vendored content, whose files are renamed but never rewritten
+VENDORED_DIR_NAMES = frozenset({"node_modules"})
+
 
 def configure_logger(log_level: str) -> None:
     """
@@ -38,6 +59,7 @@ class Args:
     source: str
     target: str
     match: str
+    jobs: int
     log_level: str
 
 
@@ -50,34 +72,31 @@ def extract_input_args() -> Args:
     """
     parser = argparse.ArgumentParser(
         description="Script to create a new Python-based image from an existing one.",
-        usage="python script.py --context-dir <directory> --source <python_version_source> --target <python_version_target> --match <match> [--log-level <level>]"
+        usage="python script.py --context-dir <directory> --source <python_version_source> --target <python_version_target> --match <match> [--jobs <jobs>] [--log-level <level>]"
     )
 
     parser.add_argument(
-        "--context-dir",
+        "--context-dir", required=True,
         help="The directory to be the context for searching.")
     parser.add_argument(
-        "--source",
+        "--source", required=True,
         help="The Python version to base the new image from.")
     parser.add_argument(
-        "--target",
+        "--target", required=True,
         help="The Python version to be used in the new image.")
     parser.add_argument(
-        "--match",
+        "--match", required=True,
         help="The string to match with the paths to base the new image from.")
+    parser.add_argument(
+        "--jobs", type=int, default=os.cpu_count() or 1,
+        help="The maximum number of `pipenv lock` commands to run in parallel. Default: %(default)s.")
     parser.add_argument(
         "--log-level", default="INFO",
         help="Set the logging level. Default: %(default)s.")
 
     args = parser.parse_args()
 
-    missing_args = [arg for arg, value in vars(args).items() if value is None]
-    if missing_args:
-        print(f"Missing required arguments: {', '.join(missing_args)}")
-        parser.print_help()
-        sys.exit(1)
-
-    return Args(args.context_dir, args.source, args.target, args.match, args.log_level)
+    return Args(args.context_dir, args.source, args.target, args.match, args.jobs, args.log_level)
 
 
 def extract_python_version(version: str) -> list[str]:
@@ -132,6 +151,18 @@ def check_input_versions_not_equal(source_version: str, target_version: str) ->
         sys.exit(1)
 
 
+def check_jobs(jobs: int) -> None:
+    """
+    Validates the maximum number of parallel jobs.
+
+    Args:
+        jobs: The maximum number of parallel jobs.
+    """
+    if jobs < 1:
+        LOGGER.error(f"Invalid number of jobs: '{jobs}'. Expected a positive integer.")
+        sys.exit(1)
+
+
 def check_os_linux() -> None:
     """
     Checks if the script is being run on a Linux operating system.
@@ -163,6 +194,7 @@ def check_requirements(args: Args) -> None:
     check_python_version(args.source)
     check_python_version(args.target)
     check_input_versions_not_equal(args.source, args.target)
+    check_jobs(args.jobs)
     check_target_python_version_installed(args.target)
     check_pipenv_installed()
 
@@ -177,37 +209,44 @@ def find_matching_paths(context_dir: str, source_version: str, match: str) -> li
         match: The string to match with the paths.
 
     Returns:
-        A list of directories that match the criteria and contain a Dockerfile.
-    """
-    blocklist = [os.path.join(".", path) for path in [".git",
-                                                      ".github",
-                                                      "ci",
-                                                      "docs",
-                                                      "manifests",
-                                                      "scripts",
-                                                      "tests"]]
-    matching_paths = []
-    processed_dirs = set()
-
-    for root, dirs, files in os.walk(context_dir):
-        if any(blocked in root for blocked in blocklist):
-            LOGGER.debug(f"Skipping '{root}' - blocked directory")
-            dirs[:] = []
-            continue
+        A sorted list of the unique directories that match the criteria and contain a Dockerfile.
+    """
+    def has_dockerfile(path: str) -> bool:
+        if os.path.lexists(os.path.join(path, "Dockerfile")):
+            LOGGER.debug(f"Found matching path with Dockerfile: '{path}'")
+            return True
+        LOGGER.debug(f"Skipping match '{path}' - Dockerfile not found")
+        return False
 
-        if source_version in root and match in root:
-            if "Dockerfile" in files and root not in processed_dirs:
-                LOGGER.debug(f"Found matching path with Dockerfile: '{root}'")
-                matching_paths.append(root)
-                processed_dirs.add(root)
+    def scan(path: str):
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            LOGGER.debug(f"Skipping '{path}' - {e}")
+            return
+
+        for entry in entries:
+            # `is_dir` is answered from the directory listing, without an extra stat call
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            # Matching whole names, rather than substrings of the path, blocks e.g. 'docs' but not 'docsfoo'
+            if entry.name in BLOCK_NAMES:
+                LOGGER.debug(f"Skipping '{entry.path}' - blocked directory")
+                continue
+            if source_version in entry.path and match in entry.path:
+                if has_dockerfile(entry.path):
+                    yield entry.path
             else:
-                LOGGER.debug(f"Skipping match '{root}' - Dockerfile not found")
-            dirs[:] = []
+                yield from scan(entry.path)
+
+    if source_version in context_dir and match in context_dir:
+        return [context_dir] if has_dockerfile(context_dir) else []
 
-    return [p for p in matching_paths if source_version in p]
+    return sorted(set(scan(context_dir)))
 
 
-def replace_python_version_on_paths(paths_list: list, source_version: str, target_version: str) -> dict[str, str]:
+def replace_python_version_on_paths(paths_list: list, source_version: str, target_version: str) -> list[tuple[str, str]]:
     """
     Replaces occurrences of the source Python version with the target version in a list of paths.
 
@@ -217,116 +256,252 @@ def replace_python_version_on_paths(paths_list: list, source_version: str, targe
         target_version: The target Python version.
 
     Returns:
-        A dictionary where keys are original paths and values are modified paths with the target version.
+        A list of (original path, modified path with the target version) pairs.
     """
-    return {path: path.replace(source_version, target_version) for path in paths_list}
+    return [(path, path.replace(source_version, target_version)) for path in paths_list]
 
 
-def copy_paths(paths_dict: dict) -> tuple[list[str], list[str]]:
+def copy_tree(src_path: str, dst_path: str) -> None:
     """
-    Copies directories from source paths to destination paths.
+    Copies a directory tree using `cp -a`, falling back to `shutil.copytree` if `cp` is not available.
+
+    Symbolic links are copied as the files or directories they point to, as the copied files are rewritten in place
+    afterwards, which would otherwise modify the link targets, e.g., files of the source image.
 
     Args:
-        paths_dict: A dictionary where keys are source paths and values are destination paths.
+        src_path: The source directory.
+        dst_path: The destination directory.
+    """
+    try:
+        # `--reflink=auto` makes the copy copy-on-write on filesystems that support it (e.g., Btrfs, XFS)
+        subprocess.run(
+            ["cp", "-a", "--dereference", "--reflink=auto", os.path.join(src_path, "."), dst_path],
+            check=True,
+            capture_output=True,
+            encoding="utf-8"
+        )
+    except FileNotFoundError:
+        LOGGER.debug("'cp' not found, falling back to shutil.copytree")
+        # `shutil.copy` goes through the `sendfile` fast path and keeps the permission bits (e.g., of scripts),
+        # without the extra per-file syscalls `shutil.copy2` makes to copy timestamps and extended attributes.
+        # Files are not hard-linked, as they are rewritten in place afterwards, which would modify the source.
+        shutil.copytree(src_path, dst_path, symlinks=False, copy_function=shutil.copy, dirs_exist_ok=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(e.stderr.strip()) from e
+
+
+def copy_paths(paths_pairs: list[tuple[str, str]]) -> tuple[list[str], list[str]]:
+    """
+    Copies directories from source paths to destination paths concurrently.
+
+    Args:
+        paths_pairs: A list of (source path, destination path) pairs.
 
     Returns:
         A tuple of two lists for the successfully and failed copied paths.
     """
     success_paths = []
     failed_paths = []
+    lock = threading.Lock()
 
-    for src_path, dst_path in paths_dict.items():
+    def _copy_one(src_path: str, dst_path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            copy_tree(src_path, dst_path)
+            with lock:
+                success_paths.append(dst_path)
+            LOGGER.debug(f"Path '{src_path}' copied to {dst_path}")
+        except Exception as e:
+            LOGGER.error(
+                f"Error copying '{src_path}' to '{dst_path}': {e}")
+            with lock:
+                failed_paths.append(dst_path)
+
+    pending = []
+    for src_path, dst_path in paths_pairs:
         if os.path.exists(dst_path):
             LOGGER.debug(f"Path '{dst_path}' already exists.")
             failed_paths.append(dst_path)
         else:
-            try:
-                os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-                shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
-                success_paths.append(dst_path)
-                LOGGER.debug(f"Path '{src_path}' copied to {dst_path}")
-            except Exception as e:
-                LOGGER.error(
-                    f"Error copying '{src_path}' to '{dst_path}': {e}")
-                failed_paths.append(dst_path)
+            pending.append((src_path, dst_path))
+
+    if pending:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+            futures = [executor.submit(_copy_one, src_path, dst_path)
+                       for src_path, dst_path in pending]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
 
     return success_paths, failed_paths
 
 
-def replace_python_version_in_file(file_path: str, source_version: str, target_version: str) -> None:
+def replace_python_version_in_file(file_path: str, replacements: tuple[tuple[str, str], ...]) -> None:
     """
     Replaces occurrences of the source Python version with the target version in a file.
 
+    The file is scanned for the source tokens first, and is only written to if a replacement was made.
+
     Args:
         file_path: The path to the file.
-        source_version: The source Python version.
-        target_version: The target Python version.
+        replacements: The (source, target) pairs returned by `build_replacements`.
     """
     LOGGER.debug(f"Replacing Python versions in '{file_path}'")
 
+    byte_replacements = encode_replacements(replacements)
     try:
-        with open(file_path, "r") as file:
-            content = file.read()
-
-        content = replace_python_version_in_content(
-            content, source_version, target_version)
-
-        with open(file_path, "w") as file:
-            file.write(content)
+        fd = os.open(file_path, os.O_RDWR)
+        try:
+            size = os.fstat(fd).st_size
+            if size == 0:
+                return
+
+            if size <= SMALL_FILE_SIZE:
+                # Small files, i.e. most of them, are cheaper to read at once than to memory-map
+                content = os.pread(fd, size, 0)
+                if not any(source in content for source, _ in byte_replacements):
+                    return
+                new_content = replace_in_text_content(content, byte_replacements)
+            else:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    # `mmap.find` is used as `in` on a mmap only checks for a single byte
+                    if all(mm.find(source) == -1 for source, _ in byte_replacements):
+                        return
+                    # The substitution runs on the mapping itself, so the file is never copied into memory as a whole
+                    new_content = replace_in_text_content(mm, byte_replacements)
+
+            if new_content is None:
+                return
+
+            os.ftruncate(fd, len(new_content))
+            view = memoryview(new_content)
+            offset = 0
+            while offset < len(view):
+                offset += os.pwrite(fd, view[offset:], offset)
+        finally:
+            os.close(fd)
     except Exception as e:
         LOGGER.debug(f"Error replacing Python versions in '{file_path}': {e}")
 
 
-def replace_python_version_in_content(content: str, source_version: str, target_version: str) -> str:
+def replace_in_text_content(content: bytes | mmap.mmap,
+                            replacements: tuple[tuple[bytes, bytes], ...]) -> bytes | None:
+    """
+    Applies the (source, target) replacement pairs to the content of a text file.
+
+    Args:
+        content: The content to modify, as bytes or a memory-mapped file.
+        replacements: The (source, target) pairs returned by `encode_replacements`.
+
+    Returns:
+        The modified content, or None if the content is unchanged.
+
+    Raises:
+        UnicodeDecodeError: If the content is not UTF-8, as binary files must be left untouched.
+    """
+    new_content = apply_replacements(content, replacements)
+    with memoryview(content) as view:
+        if view == new_content:
+            return None
+
+        # Validated in chunks, so that no decoded copy of the whole content is made
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for offset in range(0, len(view), SMALL_FILE_SIZE):
+            with view[offset:offset + SMALL_FILE_SIZE] as chunk:
+                decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+
+    return new_content
+
+
+@functools.lru_cache(maxsize=None)
+def build_replacements(source_version: str, target_version: str) -> tuple[tuple[str, str], ...]:
     """
-    Replaces occurrences of the source Python version with the target version in a content string.
+    Builds the (source, target) string pairs used to replace Python versions.
 
     Args:
-        content: The content to modify.
         source_version: The source Python version.
         target_version: The target Python version.
 
     Returns:
-        The modified content with the target Python version.
+        A tuple of (source, target) pairs, in the order they must be applied.
     """
     source_major, source_minor = extract_python_version(source_version)
     target_major, target_minor = extract_python_version(target_version)
 
-    # Example: 3.9 -> 3.11
-    result = content.replace(source_version,
-                             target_version)
+    return (
+        # Example: 3.9 -> 3.11
+        (source_version, target_version),
+        # Example: 3-9 -> 3-11
+        (f"{source_major}-{source_minor}", f"{target_major}-{target_minor}"),
+        # Example: python-39 -> python-311
+        (f"python-{source_major}{source_minor}", f"python-{target_major}{target_minor}"),
+        # Example: py39 -> py311
+        (f"py{source_major}{source_minor}", f"py{target_major}{target_minor}"),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def encode_replacements(replacements: tuple[tuple[str, str], ...]) -> tuple[tuple[bytes, bytes], ...]:
+    """
+    Encodes the (source, target) replacement pairs to UTF-8, to apply them on raw file contents.
+
+    Args:
+        replacements: The (source, target) pairs returned by `build_replacements`.
+
+    Returns:
+        A tuple of (source, target) pairs of bytes.
+    """
+    return tuple((source.encode("utf-8"), target.encode("utf-8")) for source, target in replacements)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_replacements(replacements: tuple[tuple[AnyStr, AnyStr], ...]) -> Callable[[AnyStr], AnyStr]:
+    """
+    Compiles the (source, target) replacement pairs into a single-pass substitution function.
+
+    Args:
+        replacements: The (source, target) pairs of strings or bytes.
 
-    # Example: 3-9 -> 3-11
-    result = result.replace(
-        f"{source_major}-{source_minor}",
-        f"{target_major}-{target_minor}")
+    Returns:
+        A function that applies all replacements to a string, or bytes, in one scan.
+    """
+    table = dict(replacements)
+    # Longest tokens first, so that a token is never shadowed by one of its prefixes
+    sources = sorted(table, key=len, reverse=True)
+    separator = b"|" if isinstance(sources[0], bytes) else "|"
+    pattern = re.compile(separator.join(re.escape(source) for source in sources))
+    return functools.partial(pattern.sub, lambda m: table[m.group(0)])
 
-    # Example: python-39 -> python-311
-    result = result.replace(f"python-{source_major}{source_minor}",
-                            f"python-{target_major}{target_minor}")
 
-    # Example: py39 -> py-311
-    result = result.replace(f"py{source_major}{source_minor}",
-                            f"py{target_major}{target_minor}")
+def apply_replacements(content: AnyStr, replacements: tuple[tuple[AnyStr, AnyStr], ...]) -> AnyStr:
+    """
+    Applies the (source, target) replacement pairs to a content string.
 
-    return result
+    Args:
+        content: The content to modify, as a string or a bytes-like object.
+        replacements: The (source, target) pairs, of the same type as the content.
 
+    Returns:
+        The modified content.
+    """
+    return compile_replacements(replacements)(content)
 
-def dict_to_str(dictionary: dict, enumerate_lines=False) -> str:
+
+def pairs_to_str(pairs: list[tuple[str, str]], enumerate_lines=False) -> str:
     """
-    Converts a dictionary to a string representation.
+    Converts a list of pairs to a string representation.
 
     Args:
-        dictionary: The dictionary to convert.
+        pairs: The list of pairs to convert.
         enumerate_lines: Whether to enumerate lines in the output.
 
     Returns:
-        The string representation of the dictionary.
+        The string representation of the pairs.
     """
     if enumerate_lines:
-        return '\n'.join(f"{i + 1}. '{k}' -> '{v}'" for i, (k, v) in enumerate(dictionary.items()))
+        return '\n'.join([f"{i}. '{k}' -> '{v}'" for i, (k, v) in enumerate(pairs, start=1)])
     else:
-        return '\n'.join(f"'{k}' -> '{v}'" for k, v in dictionary.items())
+        return '\n'.join([f"'{k}' -> '{v}'" for k, v in pairs])
 
 
 def list_to_str(lst: list, enumerate_lines=False) -> str:
@@ -341,7 +516,7 @@ def list_to_str(lst: list, enumerate_lines=False) -> str:
         The string representation of the list.
     """
     if enumerate_lines:
-        return "\n".join(f"{i + 1}. '{item}'" for i, item in enumerate(lst))
+        return "\n".join([f"{i}. '{item}'" for i, item in enumerate(lst, start=1)])
     else:
         return "\n".join(lst)
 
@@ -359,56 +534,85 @@ def logged_execution(title: str):
         LOGGER.info(f"{title}... Done.")
 
 
-def replace_version_in_directory(directory_path: str, source_version: str, target_version: str) -> str:
+def replace_version_in_directory(directory_path: str, replacements: tuple[tuple[str, str], ...]) -> list[str]:
     """
-    Replaces occurrences of the source Python version with the target version in file and directory names within a directory.
+    Replaces occurrences of the source Python version with the target version in the file contents and in the file
+    and directory names within a directory, collecting its Pipfiles along the way.
 
     Args:
         directory_path: The path to the directory.
-        source_version: The source Python version.
-        target_version: The target Python version.
+        replacements: The (source, target) pairs returned by `build_replacements`.
 
     Returns:
-        The path to the renamed file or directory.
+        A list of paths to the Pipfiles found, excluding lock files, as they are after the renames.
     """
     LOGGER.debug(f"Replacing Python versions in '{directory_path}'")
 
-    def rename_file_and_replace_python_version(path, filename, source_version, target_version, is_file=True) -> str:
+    def rename_replacing_python_version(path, filename, replacements, is_file=True) -> str:
         old_path = os.path.join(path, filename)
-        new_filename = replace_python_version_in_content(filename,
-                                                         source_version,
-                                                         target_version)
+        # Most names do not contain any version, so skip the substitution for them
+        if not any(source in filename for source, _ in replacements):
+            return old_path
+
+        new_filename = apply_replacements(filename, replacements)
         new_path = os.path.join(path, new_filename)
 
         if old_path != new_path:
-            os.rename(old_path, new_path)
+            os.replace(old_path, new_path)
             LOGGER.debug(
                 f"Renamed {'file' if is_file else 'directory'}: {old_path} -> {new_path}")
 
-        if is_file:
-            replace_python_version_in_file(new_path,
-                                           source_version,
-                                           target_version)
-
         return new_path
 
-    for root, dirs, files in os.walk(directory_path, topdown=False):
-        for file_name in files:
-            rename_file_and_replace_python_version(root,
-                                                   file_name,
-                                                   source_version,
-                                                   target_version,
-                                                   is_file=True)
+    pipfile_paths = []
+    dirs_to_rename = []
+
+    def walk(path: str, final_path: str, rewrite: bool, executor: concurrent.futures.Executor) -> None:
+        # `final_path` is where `path` ends up once its parent directories have been renamed
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            LOGGER.debug(f"Skipping '{path}' - {e}")
+            return
+
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    # Vendored directories are still walked to rename their entries and find Pipfiles
+                    walk(entry.path,
+                         os.path.join(final_path, apply_replacements(entry.name, replacements)),
+                         rewrite and entry.name not in VENDORED_DIR_NAMES,
+                         executor)
+                dirs_to_rename.append((path, entry.name))
+            else:
+                file_path = rename_replacing_python_version(path,
+                                                            entry.name,
+                                                            replacements,
+                                                            is_file=True)
+                if rewrite and os.path.splitext(file_path)[1].lower() not in BINARY_EXTENSIONS:
+                    executor.submit(replace_python_version_in_file, file_path, replacements)
+
+                file_name = os.path.basename(file_path)
+                if file_name.startswith("Pipfile") and "lock" not in file_name:
+                    pipfile_paths.append(os.path.join(final_path, file_name))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        walk(directory_path, directory_path, True, executor)
 
-        for dir_name in dirs:
-            rename_file_and_replace_python_version(root,
-                                                   dir_name,
-                                                   source_version,
-                                                   target_version,
-                                                   is_file=False)
+    # Directories are only renamed once all the file rewrites are done, as renaming them invalidates the file paths.
+    # Subdirectories are collected before their parents, so they are renamed first.
+    for root, dir_name in dirs_to_rename:
+        rename_replacing_python_version(root,
+                                        dir_name,
+                                        replacements,
+                                        is_file=False)
 
+    return pipfile_paths
 
-def process_paths(copied_paths: list, source_version: str, target_version: str) -> tuple[list[str], list[str]]:
+
+def process_paths(copied_paths: list, source_version: str, target_version: str,
+                  jobs: int) -> tuple[list[str], list[str]]:
     """
     Processes the list of copied paths by replacing Python versions and running `pipenv lock` on Pipfiles.
 
@@ -416,76 +620,107 @@ def process_paths(copied_paths: list, source_version: str, target_version: str)
         copied_paths: The list of copied paths to process.
         source_version: The source Python version.
         target_version: The target Python version.
+        jobs: The maximum number of `pipenv lock` commands to run in parallel.
 
     Returns:
         A tuple of two lists for the successfully and failed processed lock files.
     """
-    success_processed = []
-    failed_processed = []
+    replacements = build_replacements(source_version, target_version)
+    pipfile_paths = []
     for path in copied_paths:
         if not os.path.exists(path):
             LOGGER.warning(f"The path '{path}' does not exist.")
             continue
 
-        replace_version_in_directory(path, source_version, target_version)
-        success, failed = process_pipfiles(path, target_version)
-        success_processed.extend(success)
-        failed_processed.extend(failed)
-    return success_processed, failed_processed
+        pipfile_paths.extend(replace_version_in_directory(path, replacements))
+
+    # Lock the Pipfiles of all the copied paths together so that the `pipenv lock` runs overlap
+    return process_pipfiles(pipfile_paths, target_version, jobs)
 
 
-def process_pipfiles(path: str, target_version: str) -> tuple[list[str], list[str]]:
+def process_pipfiles(pipfile_paths: list[str], target_version: str, jobs: int) -> tuple[list[str], list[str]]:
     """
-    Processes Pipfiles in a given path by running `pipenv lock` on them.
+    Processes Pipfiles by running `pipenv lock` on them concurrently.
 
     Args:
-        path: The path to search for Pipfiles.
+        pipfile_paths: The paths to the Pipfiles to process.
         target_version: The target Python version to use with `pipenv lock`.
+        jobs: The maximum number of `pipenv lock` commands to run in parallel.
 
     Returns:
         A tuple of two lists for the successfully and failed processed lock files.
     """
     success_processed = []
     failed_processed = []
-    for root, _, files in os.walk(path):
-        for file_name in files:
-            if file_name.startswith("Pipfile") and "lock" not in file_name:
-                pipfile_path = os.path.join(root, file_name)
-                result = run_pipenv_lock(pipfile_path, target_version)
-                (success_processed if result else failed_processed).append(pipfile_path)
+    results = asyncio.run(run_pipenv_locks(pipfile_paths, target_version, jobs))
+    for pipfile_path, result in zip(pipfile_paths, results):
+        if isinstance(result, BaseException):
+            LOGGER.error(f"Error running pipenv lock for '{pipfile_path}': {result}")
+            result = False
+        (success_processed if result else failed_processed).append(pipfile_path)
     return success_processed, failed_processed
 
 
-def run_pipenv_lock(pipfile_path: str, target_version: str) -> bool:
+async def run_pipenv_locks(pipfile_paths: list[str], target_version: str,
+                           jobs: int) -> list[bool | BaseException]:
+    """
+    Runs `pipenv lock` for several Pipfiles concurrently, at most `jobs` at a time.
+
+    Pipfiles that share a directory are locked one after the other, as they share the same project.
+
+    Args:
+        pipfile_paths: The paths to the Pipfiles.
+        target_version: The target Python version to use with `pipenv lock`.
+        jobs: The maximum number of `pipenv lock` commands to run in parallel.
+
+    Returns:
+        The result of `run_pipenv_lock` for each Pipfile, or the exception it raised.
+    """
+    semaphore = asyncio.Semaphore(jobs)
+    directory_locks = collections.defaultdict(asyncio.Lock)
+    base_env = os.environ.copy()
+
+    async def run(pipfile_path: str) -> bool:
+        async with directory_locks[os.path.dirname(pipfile_path)], semaphore:
+            return await run_pipenv_lock(pipfile_path, target_version, base_env)
+
+    return await asyncio.gather(*(run(pipfile_path) for pipfile_path in pipfile_paths),
+                                return_exceptions=True)
+
+
+async def run_pipenv_lock(pipfile_path: str, target_version: str, base_env: dict[str, str]) -> bool:
     """
     Runs `pipenv lock` for a specified Pipfile to generate a new lock file.
 
     Args:
         pipfile_path: The path to the Pipfile.
         target_version: The target Python version to use with `pipenv lock`.
+        base_env: The environment to run `pipenv lock` with, built once for all the Pipfiles.
 
     Returns:
         Whether the `pipenv lock` command was successful or not.
     """
     LOGGER.info(f"Running pipenv lock for '{pipfile_path}'")
-    env = os.environ.copy()
-    env["PIPENV_PIPFILE"] = os.path.basename(pipfile_path)
+    env = {**base_env, "PIPENV_PIPFILE": os.path.basename(pipfile_path)}
 
-    try:
-        result = subprocess.run(
-            ["pipenv", "lock", "--python", target_version],
-            cwd=os.path.dirname(pipfile_path),
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            env=env,
-            encoding="utf-8"
-        )
-        LOGGER.debug(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        LOGGER.debug(e.stderr)
+    # The output is only logged at DEBUG level, so don't capture it otherwise
+    output = asyncio.subprocess.PIPE if LOGGER.isEnabledFor(logging.DEBUG) else asyncio.subprocess.DEVNULL
+
+    process = await asyncio.create_subprocess_exec(
+        "pipenv", "lock", "--python", target_version,
+        cwd=os.path.dirname(pipfile_path),
+        stdout=output,
+        stderr=output,
+        env=env
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        if stderr is not None:
+            LOGGER.debug(stderr.decode("utf-8", errors="replace"))
         return False
+    if stdout is not None:
+        LOGGER.debug(stdout.decode("utf-8", errors="replace"))
+    return True
 
 
 def manual_checks() -> list[str]:
@@ -515,19 +750,19 @@ def main():
     with logged_execution(f"Finding matching paths with '{args.match}' and Python {args.source}"):
         paths = find_matching_paths(args.context_dir, args.source, args.match)
 
-    paths_dict = replace_python_version_on_paths(paths,
-                                                 args.source,
-                                                 args.target)
+    paths_pairs = replace_python_version_on_paths(paths,
+                                                  args.source,
+                                                  args.target)
 
-    if len(paths_dict) == 0:
+    if len(paths_pairs) == 0:
         LOGGER.info("No paths found to copy.")
         sys.exit(1)
 
     LOGGER.info(
-        f"New folder(s) based on the input args:\n{dict_to_str(paths_dict, enumerate_lines=True)}")
+        f"New folder(s) based on the input args:\n{pairs_to_str(paths_pairs, enumerate_lines=True)}")
 
-    with logged_execution(f"Trying to copy {len(paths_dict)} folder(s)"):
-        success_copied_paths, failed_copied_paths = copy_paths(paths_dict)
+    with logged_execution(f"Trying to copy {len(paths_pairs)} folder(s)"):
+        success_copied_paths, failed_copied_paths = copy_paths(paths_pairs)
 
     LOGGER.info(
         f"{len(success_copied_paths)} folder(s) have been copied successfully whereas {len(failed_copied_paths)} failed.")
@@ -543,7 +778,8 @@ def main():
         with logged_execution("Processing copied folders"):
             _, failed_processed = process_paths(success_copied_paths,
                                                 args.source,
-                                                args.target)
+                                                args.target,
+                                                args.jobs)
 
         if len(failed_processed) > 0:
             LOGGER.warning(
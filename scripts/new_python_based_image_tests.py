@@ -0,0 +1,314 @@
+#! /usr/bin/env python3
+
+import asyncio
+import os
+import pathlib
+import subprocess
+
+import pytest
+
+from scripts import new_python_based_image
+from scripts.new_python_based_image import (
+    SMALL_FILE_SIZE,
+    build_replacements,
+    copy_tree,
+    find_matching_paths,
+    process_pipfiles,
+    replace_python_version_in_file,
+    replace_python_version_on_paths,
+    replace_version_in_directory,
+)
+
+REPLACEMENTS = build_replacements("3.9", "3.11")
+
+
+def create_image_dir(path: pathlib.Path, dockerfile: bool = True) -> None:
+    path.mkdir(parents=True)
+    if dockerfile:
+        (path / "Dockerfile").write_text("FROM scratch")
+
+
+class TestFindMatchingPaths:
+    def test_blocked_names_are_skipped_at_any_depth(self, tmp_path: pathlib.Path):
+        create_image_dir(tmp_path / "jupyter/ubi9-python-3.9")
+        create_image_dir(tmp_path / "ci/ubi9-python-3.9")
+        create_image_dir(tmp_path / ".github/ubi9-python-3.9")
+        create_image_dir(tmp_path / "jupyter/tests/ubi9-python-3.9")
+        create_image_dir(tmp_path / "jupyter/scripts/utils/ubi9-python-3.9")
+
+        assert find_matching_paths(str(tmp_path), "3.9", "") == [str(tmp_path / "jupyter/ubi9-python-3.9")]
+
+    def test_matches_are_not_descended_into(self, tmp_path: pathlib.Path):
+        create_image_dir(tmp_path / "jupyter/ubi9-python-3.9", dockerfile=False)
+        create_image_dir(tmp_path / "jupyter/ubi9-python-3.9/nested-3.9")
+
+        assert find_matching_paths(str(tmp_path), "3.9", "") == []
+
+    def test_match_filter(self, tmp_path: pathlib.Path):
+        create_image_dir(tmp_path / "jupyter/ubi9-python-3.9")
+        create_image_dir(tmp_path / "runtimes/ubi9-python-3.9")
+        create_image_dir(tmp_path / "runtimes/ubi9-python-3.11")
+
+        assert find_matching_paths(str(tmp_path), "3.9", "runtimes") == [str(tmp_path / "runtimes/ubi9-python-3.9")]
+
+    def test_matching_context_dir(self, tmp_path: pathlib.Path):
+        create_image_dir(tmp_path / "ubi9-python-3.9")
+        create_image_dir(tmp_path / "ubi9-python-3.9-nodockerfile", dockerfile=False)
+
+        context_dir = str(tmp_path / "ubi9-python-3.9")
+        assert find_matching_paths(context_dir, "3.9", "") == [context_dir]
+        assert find_matching_paths(str(tmp_path / "ubi9-python-3.9-nodockerfile"), "3.9", "") == []
+
+    def test_symlinked_directories_are_not_followed(self, tmp_path: pathlib.Path):
+        create_image_dir(tmp_path / "outside/ubi9-python-3.9")
+        (tmp_path / "context").mkdir()
+        (tmp_path / "context/linked").symlink_to("../outside")
+
+        assert find_matching_paths(str(tmp_path / "context"), "3.9", "") == []
+
+    def test_names_starting_with_a_blocked_name_are_not_blocked(self, tmp_path: pathlib.Path):
+        create_image_dir(tmp_path / "docsfoo/ubi9-python-3.9")
+        create_image_dir(tmp_path / "docs/ubi9-python-3.9")
+
+        assert find_matching_paths(str(tmp_path), "3.9", "") == [str(tmp_path / "docsfoo/ubi9-python-3.9")]
+
+    def test_paths_are_sorted_and_unique(self, tmp_path: pathlib.Path):
+        for path in ["runtimes/ubi9-python-3.9", "jupyter/minimal/ubi9-python-3.9", "jupyter/ubi9-python-3.9"]:
+            create_image_dir(tmp_path / path)
+
+        paths = find_matching_paths(str(tmp_path), "3.9", "")
+
+        assert paths == sorted(set(paths))
+        assert len(paths) == 3
+        assert replace_python_version_on_paths(paths, "3.9", "3.11") == [
+            (path, path.replace("3.9", "3.11")) for path in paths
+        ]
+
+
+class TestCopyTree:
+    @pytest.fixture(params=["cp", "shutil"])
+    def copy_method(self, request, monkeypatch: pytest.MonkeyPatch):
+        if request.param == "shutil":
+            def missing_cp(*args, **kwargs):
+                raise FileNotFoundError("cp")
+
+            monkeypatch.setattr(new_python_based_image.subprocess, "run", missing_cp)
+        return request.param
+
+    def test_symlinks_are_dereferenced(self, tmp_path: pathlib.Path, copy_method: str):
+        (tmp_path / "utils").mkdir()
+        (tmp_path / "utils/shared.sh").write_text("python3.9")
+        (tmp_path / "img/ubi9-python-3.9").mkdir(parents=True)
+        (tmp_path / "img/ubi9-python-3.9/shared.sh").symlink_to("../../utils/shared.sh")
+
+        copy_tree(str(tmp_path / "img/ubi9-python-3.9"), str(tmp_path / "img/ubi9-python-3.11"))
+        replace_version_in_directory(str(tmp_path / "img/ubi9-python-3.11"), REPLACEMENTS)
+
+        copied = tmp_path / "img/ubi9-python-3.11/shared.sh"
+        assert not copied.is_symlink()
+        assert copied.read_text() == "python3.11"
+        assert (tmp_path / "utils/shared.sh").read_text() == "python3.9"
+
+    def test_cp_failure_is_raised(self, tmp_path: pathlib.Path):
+        with pytest.raises(RuntimeError):
+            copy_tree(str(tmp_path / "missing"), str(tmp_path / "copy"))
+
+    def test_cp_is_used(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        calls = []
+        monkeypatch.setattr(new_python_based_image.subprocess, "run",
+                            lambda cmd, **kwargs: calls.append(cmd) or subprocess.CompletedProcess(cmd, 0))
+
+        copy_tree(str(tmp_path / "src"), str(tmp_path / "dst"))
+
+        assert calls[0][:2] == ["cp", "-a"]
+        assert "--dereference" in calls[0]
+
+
+class TestReplacePythonVersionInFile:
+    def test_token_forms(self, tmp_path: pathlib.Path):
+        file = tmp_path / "Dockerfile"
+        file.write_text("FROM ubi9/python-39\nLABEL version=3.9 name=ubi9-python-3-9 tag=py39\n")
+
+        replace_python_version_in_file(str(file), REPLACEMENTS)
+
+        assert file.read_text() == "FROM ubi9/python-311\nLABEL version=3.11 name=ubi9-python-3-11 tag=py311\n"
+
+    def test_large_file(self, tmp_path: pathlib.Path):
+        file = tmp_path / "notebook.ipynb"
+        file.write_text("é" * SMALL_FILE_SIZE + "3.9")
+
+        replace_python_version_in_file(str(file), REPLACEMENTS)
+
+        assert file.read_text() == "é" * SMALL_FILE_SIZE + "3.11"
+
+    def test_crlf_line_endings_are_kept(self, tmp_path: pathlib.Path):
+        file = tmp_path / "run.sh"
+        file.write_bytes(b"python3.9 -V\r\necho done\r\n")
+
+        replace_python_version_in_file(str(file), REPLACEMENTS)
+
+        assert file.read_bytes() == b"python3.11 -V\r\necho done\r\n"
+
+    @pytest.mark.parametrize("size", [0, 16, SMALL_FILE_SIZE * 2])
+    def test_file_without_tokens_is_not_written(self, tmp_path: pathlib.Path, size: int):
+        file = tmp_path / "README.md"
+        file.write_bytes(b"x" * size)
+        os.utime(file, ns=(0, 0))
+
+        replace_python_version_in_file(str(file), REPLACEMENTS)
+
+        assert file.read_bytes() == b"x" * size
+        assert file.stat().st_mtime_ns == 0
+
+    @pytest.mark.parametrize("size", [16, SMALL_FILE_SIZE * 2])
+    def test_non_utf8_file_is_left_alone(self, tmp_path: pathlib.Path, size: int):
+        file = tmp_path / "data.bin"
+        file.write_bytes(b"\xff" * size + b" 3.9")
+
+        replace_python_version_in_file(str(file), REPLACEMENTS)
+
+        assert file.read_bytes() == b"\xff" * size + b" 3.9"
+
+
+class TestReplaceVersionInDirectory:
+    def test_nested_directories_are_renamed_bottom_up(self, tmp_path: pathlib.Path):
+        (tmp_path / "a-3.9/b-3.9/c-3.9").mkdir(parents=True)
+        (tmp_path / "a-3.9/b-3.9/c-3.9/file-3.9.txt").write_text("py39")
+
+        replace_version_in_directory(str(tmp_path), REPLACEMENTS)
+
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*")) == [
+            "a-3.11",
+            "a-3.11/b-3.11",
+            "a-3.11/b-3.11/c-3.11",
+            "a-3.11/b-3.11/c-3.11/file-3.11.txt",
+        ]
+        assert (tmp_path / "a-3.11/b-3.11/c-3.11/file-3.11.txt").read_text() == "py311"
+
+    def test_pipfile_paths_exist_after_renames(self, tmp_path: pathlib.Path):
+        (tmp_path / "runtime-3.9/py39").mkdir(parents=True)
+        (tmp_path / "Pipfile").write_text('python_version = "3.9"')
+        (tmp_path / "Pipfile.lock").write_text("{}")
+        (tmp_path / "runtime-3.9/py39/Pipfile.gpu-3.9").write_text('python_version = "3.9"')
+
+        pipfile_paths = replace_version_in_directory(str(tmp_path), REPLACEMENTS)
+
+        assert sorted(pipfile_paths) == sorted([
+            str(tmp_path / "Pipfile"),
+            str(tmp_path / "runtime-3.11/py311/Pipfile.gpu-3.11"),
+        ])
+        for pipfile_path in pipfile_paths:
+            assert pathlib.Path(pipfile_path).read_text() == 'python_version = "3.11"'
+
+    def test_unreadable_directory_is_skipped(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        (tmp_path / "locked").mkdir()
+        (tmp_path / "other").mkdir()
+        (tmp_path / "other/Pipfile").write_text("3.9")
+
+        scandir = os.scandir
+
+        def failing_scandir(path):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return scandir(path)
+
+        monkeypatch.setattr(new_python_based_image.os, "scandir", failing_scandir)
+
+        pipfile_paths = replace_version_in_directory(str(tmp_path), REPLACEMENTS)
+
+        assert pipfile_paths == [str(tmp_path / "other/Pipfile")]
+        assert (tmp_path / "other/Pipfile").read_text() == "3.11"
+
+    def test_vendored_and_binary_files_are_renamed_but_not_rewritten(self, tmp_path: pathlib.Path):
+        (tmp_path / "node_modules/lib-3.9").mkdir(parents=True)
+        (tmp_path / "node_modules/lib-3.9/index-3.9.js").write_text("3.9")
+        (tmp_path / "ext-3.9.vsix").write_text("3.9")
+        (tmp_path / "run-3.9.sh").write_text("3.9")
+
+        replace_version_in_directory(str(tmp_path), REPLACEMENTS)
+
+        assert (tmp_path / "node_modules/lib-3.11/index-3.11.js").read_text() == "3.9"
+        assert (tmp_path / "ext-3.11.vsix").read_text() == "3.9"
+        assert (tmp_path / "run-3.11.sh").read_text() == "3.11"
+
+
+class TestProcessPipfiles:
+    @pytest.fixture
+    def fake_pipenv(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        pipenv = bin_dir / "pipenv"
+        pipenv.write_text(
+            "#!/bin/sh\n"
+            "case \"$PIPENV_PIPFILE\" in *bad*) echo 'resolution failed' >&2; exit 1;; esac\n"
+            "echo \"$@\" > \"$PIPENV_PIPFILE.lock\"\n")
+        pipenv.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+        return pipenv
+
+    def test_failures_do_not_affect_other_pipfiles(self, tmp_path: pathlib.Path, fake_pipenv: pathlib.Path,
+                                                   monkeypatch: pytest.MonkeyPatch):
+        pipfile_paths = []
+        for path in ["ok/Pipfile", "bad/Pipfile.bad", "missing/Pipfile", "ok-too/Pipfile"]:
+            (tmp_path / path).parent.mkdir()
+            (tmp_path / path).write_text("")
+            pipfile_paths.append(str(tmp_path / path))
+
+        create_subprocess_exec = asyncio.create_subprocess_exec
+
+        async def missing_pipenv_in_one_dir(*args, cwd, **kwargs):
+            if os.path.basename(cwd) == "missing":
+                raise FileNotFoundError(2, "No such file or directory", "pipenv")
+            return await create_subprocess_exec(*args, cwd=cwd, **kwargs)
+
+        monkeypatch.setattr(new_python_based_image.asyncio, "create_subprocess_exec", missing_pipenv_in_one_dir)
+
+        assert process_pipfiles(pipfile_paths, "3.11", 2) == (
+            [pipfile_paths[0], pipfile_paths[3]],
+            [pipfile_paths[1], pipfile_paths[2]],
+        )
+        assert (tmp_path / "ok/Pipfile.lock").read_text() == "lock --python 3.11\n"
+        assert (tmp_path / "ok-too/Pipfile.lock").read_text() == "lock --python 3.11\n"
+
+    def test_missing_pipenv(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("PATH", str(tmp_path))
+        (tmp_path / "Pipfile").write_text("")
+
+        assert process_pipfiles([str(tmp_path / "Pipfile")], "3.11", 2) == ([], [str(tmp_path / "Pipfile")])
+
+    def test_pipfiles_in_the_same_directory_are_locked_one_at_a_time(self, monkeypatch: pytest.MonkeyPatch):
+        running = set()
+        overlaps = []
+
+        async def run_pipenv_lock(pipfile_path, target_version, base_env):
+            directory = os.path.dirname(pipfile_path)
+            overlaps.append(directory in running)
+            running.add(directory)
+            await asyncio.sleep(0.01)
+            running.discard(directory)
+            return True
+
+        monkeypatch.setattr(new_python_based_image, "run_pipenv_lock", run_pipenv_lock)
+
+        pipfile_paths = ["a/Pipfile", "a/Pipfile.gpu", "b/Pipfile", "b/Pipfile.gpu"]
+        assert process_pipfiles(pipfile_paths, "3.11", 4) == (pipfile_paths, [])
+        assert not any(overlaps)
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_jobs_bound_the_concurrent_runs(self, monkeypatch: pytest.MonkeyPatch, jobs: int):
+        active = 0
+        max_active = 0
+
+        async def run_pipenv_lock(pipfile_path, target_version, base_env):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return True
+
+        monkeypatch.setattr(new_python_based_image, "run_pipenv_lock", run_pipenv_lock)
+
+        pipfile_paths = [f"dir{i}/Pipfile" for i in range(6)]
+        assert process_pipfiles(pipfile_paths, "3.11", jobs) == (pipfile_paths, [])
+        assert max_active == jobs